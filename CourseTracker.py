@@ -1,13 +1,16 @@
 import os
 import re
+import functools
 import sys
 import sqlite3
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, Set
 
 import customtkinter as ctk
+import tkinter
 from tkinter import filedialog, messagebox
 from tkinter import ttk
 
@@ -54,6 +57,27 @@ COLOR_NEUTRAL_HOVER = "#37474F"
 TEXT_MUTED = "#b8b8b8"
 HIGHLIGHT_BG = "#2b2b2b"
 
+# Worker threads used to walk course sections during a scan
+SCAN_WORKERS = 8
+
+# Delay before a filter keystroke triggers a rebuild
+FILTER_DEBOUNCE_MS = 150
+
+# Delay before a content resize re-wraps row labels
+WRAP_DEBOUNCE_MS = 50
+
+# Row width taken by checkbox + meta + 3 buttons + paddings (label wraps in the rest)
+RESERVED_ROW_PX = 22 + 90 + 34 + 70 + 95 + 180
+
+# Delay before section collapse toggles are written to the DB (batched)
+SECTION_STATE_FLUSH_MS = 500
+
+# Fixed height of a file row (before UI scaling); fits a name wrapped onto two lines
+ROW_HEIGHT_PX = 44
+
+# Rows materialized above and below the visible part of a section
+VIRTUAL_OVERSCAN = 5
+
 # -----------------------------
 # Helpers
 # -----------------------------
@@ -67,22 +91,68 @@ def norm(s: str) -> str:
 	return (s or "").strip().lower()
 
 
-def natural_key(s: str):
-	return [int(x) if x.isdigit() else x.lower() for x in re.split(r"(\d+)", s or "")]
+_NAT_RE = re.compile(r"(\d+)")
+_HAS_DIGIT = re.compile(r"\d").search
+
+
+@functools.lru_cache(maxsize=65536)
+def natural_key(s: str) -> tuple:
+	s = s or ""
+	# Same shape as the split result for digit-free names, without building it
+	if not _HAS_DIGIT(s):
+		return (s.lower(),)
+	# Split keeps text at even and numbers at odd positions, so tuples always compare cleanly
+	return tuple(int(x) if x.isdigit() else x.lower() for x in _NAT_RE.split(s))
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
+# Row sizes and progress totals repeat a lot between rebuilds
+@functools.lru_cache(maxsize=4096)
 def bytes_human(n: int) -> str:
-	if n is None:
+	if not n:
 		return "0 B"
-	units = ["B", "KB", "MB", "GB", "TB"]
-	f = float(n)
-	for u in units:
-		if f < 1024.0 or u == units[-1]:
-			if u == "B":
-				return f"{int(f)} {u}"
-			return f"{f:.2f} {u}"
-		f /= 1024.0
-	return f"{int(n)} B"
+	n = int(n)
+	# bit_length gives floor(log2), so //10 picks the 1024-power unit directly
+	i = min((n.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+	if i <= 0:
+		return f"{n} B"
+	return f"{n / (1 << (10 * i)):.2f} {_SIZE_UNITS[i]}"
+
+
+def wrapped_line_count(text: str, measure, width: int) -> int:
+	"""Lines a label wrapping at width needs for text (greedy word wrap, like Tk)."""
+	space = measure(" ")
+	lines, cur = 1, 0
+	for word in text.split(" "):
+		ww = measure(word)
+		if cur and cur + space + ww <= width:
+			cur += space + ww
+			continue
+		if cur:
+			lines += 1
+		# Tk breaks words longer than a line between characters
+		extra = (ww - 1) // width if ww > width else 0
+		lines += extra
+		cur = ww - extra * width
+	return lines
+
+
+def elide_to_lines(text: str, measure, width: int, max_lines: int = 2) -> str:
+	"""text, or its longest prefix + "…" that wraps onto at most max_lines lines."""
+	if width <= 0 or measure(text) <= width:
+		return text
+	if wrapped_line_count(text, measure, width) <= max_lines:
+		return text
+	lo, hi = 0, len(text) - 1
+	while lo < hi:
+		mid = (lo + hi + 1) // 2
+		if wrapped_line_count(text[:mid].rstrip() + "…", measure, width) <= max_lines:
+			lo = mid
+		else:
+			hi = mid - 1
+	return text[:lo].rstrip() + "…"
 
 
 def safe_open_file(path: str):
@@ -118,14 +188,13 @@ def reveal_in_file_manager(path: str):
 		messagebox.showerror("Explorer failed", f"Could not open file manager:\n{path}\n\n{e}")
 
 
+_IGNORED_FRAG_RE = re.compile("|".join(re.escape(f) for f in sorted(IGNORED_FOLDER_CONTAINS)))
+
+
+@functools.lru_cache(maxsize=4096)
 def folder_is_ignored(folder_name: str) -> bool:
 	n = norm(folder_name)
-	if n in IGNORED_FOLDER_EXACT:
-		return True
-	for frag in IGNORED_FOLDER_CONTAINS:
-		if frag in n:
-			return True
-	return False
+	return n in IGNORED_FOLDER_EXACT or bool(_IGNORED_FRAG_RE.search(n))
 
 
 # -----------------------------
@@ -142,6 +211,15 @@ class CourseRow:
 	last_opened_at: Optional[int]
 
 
+@dataclass
+class CourseSummary(CourseRow):
+	completed_count: int
+	total_count: int
+	completed_bytes: int
+	total_bytes: int
+	last_rel_path: Optional[str]
+
+
 @dataclass
 class GlobalLastOpened:
 	course_id: int
@@ -159,16 +237,22 @@ class GlobalLastOpened:
 
 class DB:
 	def __init__(self, db_path: str = DB_FILE):
-		self.conn = sqlite3.connect(db_path)
+		self.conn = sqlite3.connect(db_path, cached_statements=256)
 		self.conn.row_factory = sqlite3.Row
+		self.conn.set_trace_callback(None)
 		self._init()
 
 	def _init(self):
-		cur = self.conn.cursor()
-		cur.execute("PRAGMA foreign_keys = ON;")
-		cur.execute("PRAGMA journal_mode = WAL;")
-
-		cur.execute("""
+		self.conn.execute("PRAGMA foreign_keys = ON;")
+		self.conn.execute("PRAGMA journal_mode = WAL;")
+		# WAL only needs fsync at checkpoints; keep UI-triggered commits cheap
+		self.conn.execute("PRAGMA synchronous = NORMAL;")
+		self.conn.execute("PRAGMA temp_store = MEMORY;")
+		self.conn.execute("PRAGMA cache_size = -20000;")
+		self.conn.execute("PRAGMA mmap_size = 268435456;")
+		self.conn.execute("PRAGMA wal_autocheckpoint = 1000;")
+
+		self.conn.execute("""
 		CREATE TABLE IF NOT EXISTS courses (
 			id INTEGER PRIMARY KEY AUTOINCREMENT,
 			path TEXT NOT NULL UNIQUE,
@@ -179,7 +263,7 @@ class DB:
 		);
 		""")
 
-		cur.execute("""
+		self.conn.execute("""
 		CREATE TABLE IF NOT EXISTS items (
 			id INTEGER PRIMARY KEY AUTOINCREMENT,
 			course_id INTEGER NOT NULL,
@@ -191,12 +275,13 @@ class DB:
 			size_bytes INTEGER NOT NULL,
 			mtime INTEGER NOT NULL,
 			ignored INTEGER NOT NULL DEFAULT 0,
+			completed INTEGER NOT NULL DEFAULT 0,
 			UNIQUE(course_id, rel_path),
 			FOREIGN KEY(course_id) REFERENCES courses(id) ON DELETE CASCADE
 		);
 		""")
 
-		cur.execute("""
+		self.conn.execute("""
 		CREATE TABLE IF NOT EXISTS progress (
 			item_id INTEGER PRIMARY KEY,
 			completed INTEGER NOT NULL DEFAULT 0,
@@ -208,7 +293,7 @@ class DB:
 		""")
 
 		# Persist collapsed/expanded section state per course
-		cur.execute("""
+		self.conn.execute("""
 		CREATE TABLE IF NOT EXISTS section_state (
 			course_id INTEGER NOT NULL,
 			section TEXT NOT NULL,
@@ -218,11 +303,36 @@ class DB:
 		);
 		""")
 
-		cur.execute("CREATE INDEX IF NOT EXISTS idx_items_course ON items(course_id);")
-		cur.execute("CREATE INDEX IF NOT EXISTS idx_items_course_ignored ON items(course_id, ignored);")
-		cur.execute("CREATE INDEX IF NOT EXISTS idx_progress_last_opened ON progress(last_opened_at);")
+		# items.completed mirrors progress so course aggregates need no join; add and backfill it on older DBs
+		if self._ensure_column("items", "completed", "INTEGER NOT NULL DEFAULT 0"):
+			self.conn.execute("""
+			UPDATE items
+			SET completed = COALESCE((SELECT p.completed FROM progress p WHERE p.item_id = items.id), 0);
+			""")
+
+		# Covering index: course listing/aggregation reads section, rel_path, size and completion from index pages.
+		# It (and the UNIQUE(course_id, rel_path) autoindex) makes the older course_id indexes redundant.
+		self.conn.execute("DROP INDEX IF EXISTS idx_items_course;")
+		self.conn.execute("DROP INDEX IF EXISTS idx_items_course_ignored;")
+		self.conn.execute("""
+		CREATE INDEX IF NOT EXISTS idx_items_course_summary
+		ON items(course_id, ignored, section, rel_path, size_bytes, completed);
+		""")
+		self.conn.execute("CREATE INDEX IF NOT EXISTS idx_progress_last_opened ON progress(last_opened_at);")
 		self.conn.commit()
 
+		# Refresh planner statistics so the covering index gets picked
+		self.conn.execute("ANALYZE;")
+		self.conn.commit()
+
+	def _ensure_column(self, table: str, column: str, ddl: str) -> bool:
+		"""Add a column to an existing table; returns True if it was added."""
+		cols = {str(r["name"]) for r in self.conn.execute(f"PRAGMA table_xinfo({table});")}
+		if column in cols:
+			return False
+		self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl};")
+		return True
+
 	def close(self):
 		try:
 			self.conn.close()
@@ -234,135 +344,143 @@ class DB:
 	def upsert_course(self, course_path: str) -> int:
 		name = os.path.basename(course_path.rstrip("\\/")) or course_path
 		ts = now_ts()
-		cur = self.conn.cursor()
-		cur.execute("""
-		INSERT INTO courses(path, name, created_at)
-		VALUES (?, ?, ?)
-		ON CONFLICT(path) DO UPDATE SET
-			name = excluded.name;
-		""", (course_path, name, ts))
-		self.conn.commit()
+		with self.conn:
+			self.conn.execute("""
+			INSERT INTO courses(path, name, created_at)
+			VALUES (?, ?, ?)
+			ON CONFLICT(path) DO UPDATE SET
+				name = excluded.name;
+			""", (course_path, name, ts))
 		return self.get_course_id(course_path)
 
 	def get_course_id(self, course_path: str) -> int:
-		cur = self.conn.cursor()
-		cur.execute("SELECT id FROM courses WHERE path = ?", (course_path,))
-		row = cur.fetchone()
+		row = self.conn.execute("SELECT id FROM courses WHERE path = ?", (course_path,)).fetchone()
 		if not row:
 			raise RuntimeError("Course not found after upsert.")
 		return int(row["id"])
 
-	def list_courses(self) -> List[CourseRow]:
-		cur = self.conn.cursor()
-		cur.execute("""
+	def get_course(self, course_id: int) -> Optional[CourseRow]:
+		r = self.conn.execute("""
 		SELECT id, path, name, created_at, last_opened_item_id, last_opened_at
 		FROM courses
-		ORDER BY COALESCE(last_opened_at, created_at) DESC, name ASC;
+		WHERE id = ?;
+		""", (course_id,)).fetchone()
+		return self._course_row(r) if r else None
+
+	@staticmethod
+	def _course_row(r: sqlite3.Row) -> CourseRow:
+		return CourseRow(
+			id=int(r["id"]),
+			path=str(r["path"]),
+			name=str(r["name"]),
+			created_at=int(r["created_at"]),
+			last_opened_item_id=(int(r["last_opened_item_id"]) if r["last_opened_item_id"] is not None else None),
+			last_opened_at=(int(r["last_opened_at"]) if r["last_opened_at"] is not None else None),
+		)
+
+	def list_courses_with_stats(self) -> List[CourseSummary]:
+		"""Courses plus progress totals and last-opened path in a single query."""
+		cur = self.conn.execute("""
+		SELECT
+			c.id, c.path, c.name, c.created_at, c.last_opened_item_id, c.last_opened_at,
+			COALESCE(SUM(i.completed), 0) AS completed_count,
+			COUNT(i.id) AS total_count,
+			COALESCE(SUM(i.completed * i.size_bytes), 0) AS completed_bytes,
+			COALESCE(SUM(i.size_bytes), 0) AS total_bytes,
+			li.rel_path AS last_rel_path
+		FROM courses c
+		LEFT JOIN items li ON li.id = c.last_opened_item_id
+		LEFT JOIN items i ON i.course_id = c.id AND i.ignored = 0
+		GROUP BY c.id
+		ORDER BY COALESCE(c.last_opened_at, c.created_at) DESC, c.name ASC;
 		""")
-		out: List[CourseRow] = []
+		out: List[CourseSummary] = []
 		for r in cur.fetchall():
-			out.append(CourseRow(
-				id=int(r["id"]),
-				path=str(r["path"]),
-				name=str(r["name"]),
-				created_at=int(r["created_at"]),
-				last_opened_item_id=(int(r["last_opened_item_id"]) if r["last_opened_item_id"] is not None else None),
-				last_opened_at=(int(r["last_opened_at"]) if r["last_opened_at"] is not None else None),
+			out.append(CourseSummary(
+				**vars(self._course_row(r)),
+				completed_count=int(r["completed_count"]),
+				total_count=int(r["total_count"]),
+				completed_bytes=int(r["completed_bytes"]),
+				total_bytes=int(r["total_bytes"]),
+				last_rel_path=(str(r["last_rel_path"]) if r["last_rel_path"] is not None else None),
 			))
 		return out
 
 	def delete_course(self, course_id: int):
-		cur = self.conn.cursor()
-		cur.execute("DELETE FROM courses WHERE id = ?", (course_id,))
-		self.conn.commit()
+		with self.conn:
+			self.conn.execute("DELETE FROM courses WHERE id = ?", (course_id,))
 
 	# ----- section collapse state -----
 
 	def get_section_collapsed_map(self, course_id: int) -> Dict[str, bool]:
-		cur = self.conn.cursor()
-		cur.execute("SELECT section, collapsed FROM section_state WHERE course_id = ?", (course_id,))
 		out: Dict[str, bool] = {}
-		for r in cur.fetchall():
+		for r in self.conn.execute("SELECT section, collapsed FROM section_state WHERE course_id = ?", (course_id,)):
 			out[str(r["section"])] = (int(r["collapsed"]) == 1)
 		return out
 
-	def set_section_collapsed(self, course_id: int, section: str, collapsed: bool):
-		cur = self.conn.cursor()
-		cur.execute("""
-		INSERT INTO section_state(course_id, section, collapsed)
-		VALUES (?, ?, ?)
-		ON CONFLICT(course_id, section) DO UPDATE SET
-			collapsed = excluded.collapsed;
-		""", (course_id, section, 1 if collapsed else 0))
-		self.conn.commit()
+	def set_sections_collapsed(self, course_id: int, states: Dict[str, bool]):
+		"""Persist several section collapse states in one transaction."""
+		with self.conn:
+			self.conn.executemany("""
+			INSERT INTO section_state(course_id, section, collapsed)
+			VALUES (?, ?, ?)
+			ON CONFLICT(course_id, section) DO UPDATE SET
+				collapsed = excluded.collapsed;
+			""", [(course_id, section, 1 if collapsed else 0) for section, collapsed in states.items()])
 
 	def clear_section_state(self, course_id: int):
 		"""Reset remembered collapsed sections for this course."""
-		cur = self.conn.cursor()
-		cur.execute("DELETE FROM section_state WHERE course_id = ?", (course_id,))
-		self.conn.commit()
+		with self.conn:
+			self.conn.execute("DELETE FROM section_state WHERE course_id = ?", (course_id,))
 
 	# ----- items/progress -----
 
-	def upsert_item(
-		self,
-		course_id: int,
-		rel_path: str,
-		abs_path: str,
-		section: str,
-		name: str,
-		ext: str,
-		size_bytes: int,
-		mtime: int,
-		ignored: int
-	) -> int:
-		cur = self.conn.cursor()
-		cur.execute("""
-		INSERT INTO items(course_id, rel_path, abs_path, section, name, ext, size_bytes, mtime, ignored)
-		VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-		ON CONFLICT(course_id, rel_path) DO UPDATE SET
-			abs_path = excluded.abs_path,
-			section = excluded.section,
-			name = excluded.name,
-			ext = excluded.ext,
-			size_bytes = excluded.size_bytes,
-			mtime = excluded.mtime,
-			ignored = excluded.ignored;
-		""", (course_id, rel_path, abs_path, section, name, ext, int(size_bytes), int(mtime), int(ignored)))
-		self.conn.commit()
-
-		cur.execute("SELECT id FROM items WHERE course_id=? AND rel_path=?", (course_id, rel_path))
-		item_id = int(cur.fetchone()["id"])
-
-		cur.execute("INSERT INTO progress(item_id) VALUES (?) ON CONFLICT(item_id) DO NOTHING;", (item_id,))
-		self.conn.commit()
-		return item_id
+	def upsert_items_bulk(self, course_id: int, rows: List[Tuple[str, str, str, str, str, int, int, int]]):
+		"""Rows are (rel_path, abs_path, section, name, ext, size_bytes, mtime, ignored); one commit."""
+		with self.conn:
+			self.conn.executemany("""
+			INSERT INTO items(course_id, rel_path, abs_path, section, name, ext, size_bytes, mtime, ignored)
+			VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+			ON CONFLICT(course_id, rel_path) DO UPDATE SET
+				abs_path = excluded.abs_path,
+				section = excluded.section,
+				name = excluded.name,
+				ext = excluded.ext,
+				size_bytes = excluded.size_bytes,
+				mtime = excluded.mtime,
+				ignored = excluded.ignored;
+			""", [(course_id, *r) for r in rows])
+
+			# One statement seeds progress for every new item (no per-row id lookup)
+			self.conn.execute("""
+			INSERT INTO progress(item_id)
+			SELECT id FROM items WHERE course_id = ?
+			ON CONFLICT(item_id) DO NOTHING;
+			""", (course_id,))
 
 	def delete_missing_items(self, course_id: int, keep_rel_paths: set):
-		cur = self.conn.cursor()
-		cur.execute("SELECT rel_path FROM items WHERE course_id = ?", (course_id,))
-		existing = {str(r["rel_path"]) for r in cur.fetchall()}
-		to_delete = existing - keep_rel_paths
-		if not to_delete:
-			return
-		cur.executemany(
-			"DELETE FROM items WHERE course_id=? AND rel_path=?",
-			[(course_id, rp) for rp in to_delete]
-		)
-		self.conn.commit()
+		# Set difference runs inside SQLite: stage the kept paths, then one DELETE
+		with self.conn:
+			self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS tmp_keep(rel_path TEXT PRIMARY KEY);")
+			self.conn.execute("DELETE FROM tmp_keep;")
+			self.conn.executemany("INSERT OR IGNORE INTO tmp_keep(rel_path) VALUES (?);", [(p,) for p in keep_rel_paths])
+			self.conn.execute("""
+			DELETE FROM items
+			WHERE course_id = ? AND rel_path NOT IN (SELECT rel_path FROM tmp_keep);
+			""", (course_id,))
+			self.conn.execute("DELETE FROM tmp_keep;")
 
 	def get_course_items(self, course_id: int, include_ignored: bool = False) -> List[sqlite3.Row]:
-		cur = self.conn.cursor()
 		if include_ignored:
-			cur.execute("""
-			SELECT i.*, p.completed, p.completed_at, p.last_opened_at, p.open_count
+			cur = self.conn.execute("""
+			SELECT i.*, p.completed_at, p.last_opened_at, p.open_count
 			FROM items i
 			LEFT JOIN progress p ON p.item_id = i.id
 			WHERE i.course_id = ?;
 			""", (course_id,))
 		else:
-			cur.execute("""
-			SELECT i.*, p.completed, p.completed_at, p.last_opened_at, p.open_count
+			cur = self.conn.execute("""
+			SELECT i.*, p.completed_at, p.last_opened_at, p.open_count
 			FROM items i
 			LEFT JOIN progress p ON p.item_id = i.id
 			WHERE i.course_id = ? AND i.ignored = 0;
@@ -370,36 +488,53 @@ class DB:
 		return cur.fetchall()
 
 	def set_completed(self, item_id: int, completed: bool):
-		cur = self.conn.cursor()
-		ts = now_ts() if completed else None
-		cur.execute("""
+		self.set_completed_many({item_id: completed})
+
+	def set_completed_many(self, states: Dict[int, bool]):
+		"""Persist several completion toggles in one transaction."""
+		with self.conn:
+			self._write_completed(states, now_ts())
+
+	def record_open(self, course_id: int, item_id: int):
+		# Both updates commit (or roll back) together
+		with self.conn:
+			self._write_open(course_id, item_id, now_ts())
+
+	def advance(self, course_id: int, completed_item_id: int, next_open_item_id: int):
+		"""Mark an item completed and record opening the next one, in one transaction."""
+		ts = now_ts()
+		with self.conn:
+			self._write_completed({completed_item_id: True}, ts)
+			self._write_open(course_id, next_open_item_id, ts)
+
+	def _write_completed(self, states: Dict[int, bool], ts: int):
+		self.conn.executemany("""
 		UPDATE progress
 		SET completed = ?,
 			completed_at = ?
 		WHERE item_id = ?;
-		""", (1 if completed else 0, ts, item_id))
-		self.conn.commit()
+		""", [(1 if done else 0, ts if done else None, item_id) for item_id, done in states.items()])
+		self.conn.executemany(
+			"UPDATE items SET completed = ? WHERE id = ?;",
+			[(1 if done else 0, item_id) for item_id, done in states.items()]
+		)
 
-	def record_open(self, course_id: int, item_id: int):
-		cur = self.conn.cursor()
-		ts = now_ts()
-		cur.execute("""
+	def _write_open(self, course_id: int, item_id: int, ts: int):
+		self.conn.execute("""
 		UPDATE progress
 		SET last_opened_at = ?,
 			open_count = open_count + 1
 		WHERE item_id = ?;
 		""", (ts, item_id))
-		cur.execute("""
+		self.conn.execute("""
 		UPDATE courses
 		SET last_opened_item_id = ?,
 			last_opened_at = ?
 		WHERE id = ?;
 		""", (item_id, ts, course_id))
-		self.conn.commit()
 
 	def get_global_last_opened(self) -> Optional[GlobalLastOpened]:
-		cur = self.conn.cursor()
-		cur.execute("""
+		cur = self.conn.execute("""
 		SELECT
 			c.id AS course_id, c.path AS course_path, c.name AS course_name,
 			i.id AS item_id, i.abs_path AS abs_path, i.rel_path AS rel_path,
@@ -425,24 +560,21 @@ class DB:
 		)
 
 	def get_progress_for_course(self, course_id: int) -> Tuple[int, int, int, int]:
-		cur = self.conn.cursor()
-		cur.execute("""
+		cur = self.conn.execute("""
 		SELECT
-			COALESCE(SUM(CASE WHEN p.completed=1 THEN 1 ELSE 0 END), 0) AS completed_count,
+			COALESCE(SUM(completed), 0) AS completed_count,
 			COUNT(*) AS total_count,
-			COALESCE(SUM(CASE WHEN p.completed=1 THEN i.size_bytes ELSE 0 END), 0) AS completed_bytes,
-			COALESCE(SUM(i.size_bytes), 0) AS total_bytes
-		FROM items i
-		LEFT JOIN progress p ON p.item_id = i.id
-		WHERE i.course_id = ? AND i.ignored = 0;
+			COALESCE(SUM(completed * size_bytes), 0) AS completed_bytes,
+			COALESCE(SUM(size_bytes), 0) AS total_bytes
+		FROM items
+		WHERE course_id = ? AND ignored = 0;
 		""", (course_id,))
 		r = cur.fetchone()
 		return (int(r["completed_count"]), int(r["total_count"]), int(r["completed_bytes"]), int(r["total_bytes"]))
 
 	def get_item_by_id(self, item_id: int) -> Optional[sqlite3.Row]:
-		cur = self.conn.cursor()
-		cur.execute("""
-		SELECT i.*, p.completed, p.completed_at, p.last_opened_at, p.open_count
+		cur = self.conn.execute("""
+		SELECT i.*, p.completed_at, p.last_opened_at, p.open_count
 		FROM items i
 		LEFT JOIN progress p ON p.item_id = i.id
 		WHERE i.id = ?;
@@ -464,68 +596,81 @@ class Scanner:
 			raise RuntimeError("Selected course path is not a folder.")
 
 		course_id = self.db.upsert_course(course_path)
-		keep_rel = set()
 
 		try:
 			top = [d for d in os.listdir(course_path) if os.path.isdir(os.path.join(course_path, d))]
 		except Exception as e:
 			raise RuntimeError(str(e))
 
+		top = [d for d in top if not folder_is_ignored(d)]
 		top.sort(key=natural_key)
 
-		for section_name in top:
-			if folder_is_ignored(section_name):
-				continue
-
-			section_path = os.path.join(course_path, section_name)
-
-			for root, dirnames, filenames in os.walk(section_path):
-				dirnames.sort(key=natural_key)
-				filenames.sort(key=natural_key)
-
-				# prune ignored folders
-				pruned = [dn for dn in list(dirnames) if folder_is_ignored(dn)]
-				for dn in pruned:
-					if dn in dirnames:
-						dirnames.remove(dn)
-
-				for fn in filenames:
-					abs_path = os.path.join(root, fn)
-					if not os.path.isfile(abs_path):
-						continue
-
-					ext = os.path.splitext(fn)[1].lower()
-					if ext in IGNORED_EXTENSIONS:
-						continue
-
-					rel_path = os.path.relpath(abs_path, course_path)
-					keep_rel.add(rel_path)
-
-					try:
-						size_bytes = os.path.getsize(abs_path)
-					except Exception:
-						size_bytes = 0
-
-					try:
-						mtime = int(os.path.getmtime(abs_path))
-					except Exception:
-						mtime = 0
-
-					self.db.upsert_item(
-						course_id=course_id,
-						rel_path=rel_path,
-						abs_path=abs_path,
-						section=section_name,
-						name=fn,
-						ext=ext,
-						size_bytes=size_bytes,
-						mtime=mtime,
-						ignored=0
-					)
+		# Filesystem walks run in parallel per section; SQLite stays on this thread
+		rows: List[Tuple[str, str, str, str, str, int, int, int]] = []
+		if top:
+			with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(top))) as pool:
+				for section_rows in pool.map(lambda s: self._scan_section(course_path, s), top):
+					rows.extend(section_rows)
 
+		keep_rel = {r[0] for r in rows}
+		self.db.upsert_items_bulk(course_id, rows)
 		self.db.delete_missing_items(course_id, keep_rel_paths=keep_rel)
 		return course_id
 
+	def _scan_section(self, course_path: str, section_name: str) -> List[Tuple[str, str, str, str, str, int, int, int]]:
+		"""Collect item rows for one top-level section (no DB access)."""
+		rows: List[Tuple[str, str, str, str, str, int, int, int]] = []
+		section_path = os.path.join(course_path, section_name)
+
+		for entry in self._iter_files(section_path):
+			fn = entry.name
+			ext = os.path.splitext(fn)[1].lower()
+			if ext in IGNORED_EXTENSIONS:
+				continue
+
+			abs_path = entry.path
+			rel_path = os.path.relpath(abs_path, course_path)
+
+			# DirEntry caches the stat result: one syscall for size + mtime
+			try:
+				st = entry.stat()
+				size_bytes = st.st_size
+				mtime = int(st.st_mtime)
+			except Exception:
+				size_bytes = 0
+				mtime = 0
+
+			rows.append((rel_path, abs_path, section_name, fn, ext, size_bytes, mtime, 0))
+
+		return rows
+
+	def _iter_files(self, dir_path: str):
+		"""Yield file DirEntry objects in natural order, skipping ignored folders."""
+		try:
+			with os.scandir(dir_path) as it:
+				entries = list(it)
+		except OSError:
+			return
+
+		files = []
+		dirs = []
+		for entry in entries:
+			try:
+				if entry.is_dir(follow_symlinks=False):
+					if not folder_is_ignored(entry.name):
+						dirs.append(entry)
+				elif entry.is_file():
+					files.append(entry)
+			except OSError:
+				continue
+
+		files.sort(key=lambda e: natural_key(e.name))
+		dirs.sort(key=lambda e: natural_key(e.name))
+
+		yield from files
+		for d in dirs:
+			yield from self._iter_files(d.path)
+
 
 # -----------------------------
 # UI Pages
@@ -536,6 +681,14 @@ class LibraryPage(ctk.CTkFrame):
 		super().__init__(master)
 		self.app = app
 
+		# Snapshot of (course, name_lc, path_lc); search filters it without touching the DB
+		self._library_cache: Optional[List[Tuple[CourseSummary, str, str]]] = None
+		# Card progress labels (files, size) per course id, for in-place updates
+		self._card_progress_lbls: Dict[int, Tuple[ctk.CTkLabel, ctk.CTkLabel]] = {}
+		# Changes made while the library was hidden; applied by flush_pending()
+		self._needs_reload = False
+		self._stale_progress: Set[int] = set()
+
 		self.grid_rowconfigure(2, weight=1)
 		self.grid_columnconfigure(0, weight=1)
 
@@ -638,13 +791,15 @@ class LibraryPage(ctk.CTkFrame):
 			self.table_frame.grid(**grid_opts)
 		self.refresh()
 
-	def refresh(self):
-		courses = self.app.db.list_courses()
+	def refresh(self, force: bool = False):
+		"""Re-render the library; force=True reloads the course snapshot from the DB."""
+		if force or self._library_cache is None:
+			self._library_cache = [(c, norm(c.name), norm(c.path)) for c in self.app.db.list_courses_with_stats()]
 		q = norm(self.search_var.get())
 
-		visible: List[CourseRow] = []
-		for c in courses:
-			if q and (q not in norm(c.name) and q not in norm(c.path)):
+		visible: List[CourseSummary] = []
+		for c, name_lc, path_lc in self._library_cache:
+			if q and (q not in name_lc and q not in path_lc):
 				continue
 			visible.append(c)
 
@@ -652,6 +807,7 @@ class LibraryPage(ctk.CTkFrame):
 
 		for w in self.cards_scroll.winfo_children():
 			w.destroy()
+		self._card_progress_lbls.clear()
 		for iid in self.tree.get_children():
 			self.tree.delete(iid)
 
@@ -660,15 +816,9 @@ class LibraryPage(ctk.CTkFrame):
 		cc = 0
 
 		for course in visible:
-			completed_count, total_count, completed_bytes, total_bytes = self.app.db.get_progress_for_course(course.id)
-			files_pct = (completed_count / total_count * 100.0) if total_count else 0.0
-			size_pct = (completed_bytes / total_bytes * 100.0) if total_bytes else 0.0
+			files_pct, size_pct, files_text, size_text = self._progress_texts(course)
 
-			last_text = "N/A"
-			if course.last_opened_item_id:
-				it = self.app.db.get_item_by_id(course.last_opened_item_id)
-				if it:
-					last_text = str(it["rel_path"])
+			last_text = course.last_rel_path or "N/A"
 
 			# Cards view
 			card = ctk.CTkFrame(self.cards_scroll)
@@ -681,15 +831,12 @@ class LibraryPage(ctk.CTkFrame):
 			path_lbl = ctk.CTkLabel(card, text=course.path, anchor="w", text_color=TEXT_MUTED)
 			path_lbl.grid(row=1, column=0, padx=12, pady=(2, 8), sticky="ew")
 
-			p1 = ctk.CTkLabel(card, text=f"Files: {files_pct:.1f}% ({completed_count}/{total_count})", anchor="w")
+			p1 = ctk.CTkLabel(card, text=files_text, anchor="w")
 			p1.grid(row=2, column=0, padx=12, pady=(2, 0), sticky="ew")
 
-			p2 = ctk.CTkLabel(
-				card,
-				text=f"Size: {size_pct:.1f}% ({bytes_human(completed_bytes)} / {bytes_human(total_bytes)})",
-				anchor="w"
-			)
+			p2 = ctk.CTkLabel(card, text=size_text, anchor="w")
 			p2.grid(row=3, column=0, padx=12, pady=(2, 0), sticky="ew")
+			self._card_progress_lbls[course.id] = (p1, p2)
 
 			last_lbl = ctk.CTkLabel(card, text=f"Last: {last_text}", anchor="w")
 			last_lbl.grid(row=4, column=0, padx=12, pady=(2, 10), sticky="ew")
@@ -736,9 +883,58 @@ class LibraryPage(ctk.CTkFrame):
 			# Table view
 			self.tree.insert(
 				"", "end", iid=str(course.id),
-				values=(course.name, f"{files_pct:.1f}%", f"{size_pct:.1f}%", last_text, course.path)
+				values=(course.name, files_pct, size_pct, last_text, course.path)
 			)
 
+	@staticmethod
+	def _progress_texts(course: CourseSummary) -> Tuple[str, str, str, str]:
+		"""(files %, size %, card files line, card size line) for a course."""
+		files_pct = (course.completed_count / course.total_count * 100.0) if course.total_count else 0.0
+		size_pct = (course.completed_bytes / course.total_bytes * 100.0) if course.total_bytes else 0.0
+		return (
+			f"{files_pct:.1f}%",
+			f"{size_pct:.1f}%",
+			f"Files: {files_pct:.1f}% ({course.completed_count}/{course.total_count})",
+			f"Size: {size_pct:.1f}% ({bytes_human(course.completed_bytes)} / {bytes_human(course.total_bytes)})",
+		)
+
+	def invalidate(self, course_id: Optional[int] = None):
+		"""Mark the library stale (only course_id's progress, if given); re-rendered when next shown."""
+		if course_id is None:
+			self._needs_reload = True
+		else:
+			self._stale_progress.add(course_id)
+
+	def flush_pending(self):
+		"""Apply changes queued by invalidate()."""
+		if self._needs_reload:
+			self._needs_reload = False
+			self._stale_progress.clear()
+			self.refresh(force=True)
+			return
+		for course_id in self._stale_progress:
+			self.refresh_progress_only(course_id)
+		self._stale_progress.clear()
+
+	def refresh_progress_only(self, course_id: int):
+		"""Update one course's progress figures in place, without re-rendering the library."""
+		if self._library_cache is None:
+			return
+		course = next((c for c, _n, _p in self._library_cache if c.id == course_id), None)
+		if course is None:
+			return
+		(course.completed_count, course.total_count,
+			course.completed_bytes, course.total_bytes) = self.app.db.get_progress_for_course(course_id)
+
+		files_pct, size_pct, files_text, size_text = self._progress_texts(course)
+		lbls = self._card_progress_lbls.get(course_id)
+		if lbls:
+			lbls[0].configure(text=files_text)
+			lbls[1].configure(text=size_text)
+		if self.tree.exists(str(course_id)):
+			self.tree.set(str(course_id), "files_pct", files_pct)
+			self.tree.set(str(course_id), "size_pct", size_pct)
+
 	def _remove_course(self, course_id: int, course_name: str):
 		ok = messagebox.askyesno(
 			"Remove course",
@@ -747,7 +943,7 @@ class LibraryPage(ctk.CTkFrame):
 		if not ok:
 			return
 		self.app.db.delete_course(course_id)
-		self.refresh()
+		self.refresh(force=True)
 
 
 class CoursePage(ctk.CTkFrame):
@@ -759,22 +955,62 @@ class CoursePage(ctk.CTkFrame):
 		self.course_path: Optional[str] = None
 		self.course_name: Optional[str] = None
 
+		# Shared by every section header (one Tk font instead of one per section)
+		self._section_font = ctk.CTkFont(size=15, weight="bold")
+
 		self.ordered_item_ids: List[int] = []
+		# item_id -> position in ordered_item_ids
+		self._index_of_id: Dict[int, int] = {}
+		# Item data for the whole course; widgets only exist for rows near the viewport
+		self.item_data: Dict[int, sqlite3.Row] = {}
+		self.item_done: Dict[int, bool] = {}
+		# Casefolded item names, matched by the filter box
+		self.item_name_cf: Dict[int, str] = {}
 		self.item_widgets: Dict[int, Dict] = {}
+		# Detached row widgets kept for reuse instead of being destroyed
+		self._row_pool: List[Dict] = []
+		self.highlighted_item_id: Optional[int] = None
 
 		# section UI state
 		self.section_headers: Dict[str, ctk.CTkFrame] = {}
 		self.section_containers: Dict[str, ctk.CTkFrame] = {}
 		self.section_toggle_btns: Dict[str, ctk.CTkButton] = {}
+		self.section_progress_lbls: Dict[str, ctk.CTkLabel] = {}
+		# All item ids per section (natural order), ids passing the filter, and sections currently shown
+		self.section_item_ids: Dict[str, List[int]] = {}
+		self.section_shown_ids: Dict[str, List[int]] = {}
+		self.visible_sections: List[str] = []
+		# Sections whose row container is currently packed
+		self._packed_sections: Set[str] = set()
+		# Viewport windowing: materialized rows (+ which spacers are packed) per section
+		self.section_window: Dict[str, Tuple[Tuple[int, ...], bool, bool]] = {}
+		self.section_spacers: Dict[str, Tuple[ctk.CTkFrame, ctk.CTkFrame]] = {}
+		self._viewport_after_id: Optional[str] = None
+		# Row label wraplength, derived from the content width (debounced)
+		self._content_width = 0
+		self._wrap_length = 0
+		self._wrap_after_id: Optional[str] = None
+		# Shared row label font (measured to elide names to two lines) and the full-name tooltip
+		self._row_font = ctk.CTkFont()
+		self._elided: Dict[Tuple[str, float], str] = {}
+		self._name_tip: Optional[tkinter.Toplevel] = None
 
 		# Persisted state (DB-backed)
 		self.section_persisted_collapsed: Dict[str, bool] = {}
 		# View state (can be temporarily overridden by "collapse all")
 		self.section_view_collapsed: Dict[str, bool] = {}
+		# Persisted toggles not yet written to the DB
+		self._dirty_sections: Dict[str, bool] = {}
+		self._section_flush_after_id: Optional[str] = None
 
 		# Filters
 		self.filter_var = ctk.StringVar(value="")
 		self.hide_completed_var = ctk.BooleanVar(value=False)
+		self._filter_after_id: Optional[str] = None
+
+		# Checkbox toggles not yet written to the DB
+		self._pending_toggles: Dict[int, bool] = {}
+		self._toggle_after_id: Optional[str] = None
 
 		self.grid_rowconfigure(3, weight=1)
 		self.grid_columnconfigure(0, weight=1)
@@ -829,11 +1065,11 @@ class CoursePage(ctk.CTkFrame):
 
 		self.filter_entry = ctk.CTkEntry(filters, textvariable=self.filter_var, placeholder_text="Filter files by name...")
 		self.filter_entry.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
-		self.filter_entry.bind("<KeyRelease>", lambda _e: self._rebuild_ui(highlight_last=False))
+		self.filter_entry.bind("<KeyRelease>", self._on_filter_key)
 
 		self.hide_done_chk = ctk.CTkCheckBox(
 			filters, text="Hide completed",
-			variable=self.hide_completed_var, command=self._rebuild_ui
+			variable=self.hide_completed_var, command=self._apply_filter
 		)
 		self.hide_done_chk.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="e")
 
@@ -856,19 +1092,111 @@ class CoursePage(ctk.CTkFrame):
 		self.content = ctk.CTkScrollableFrame(self, label_text="Sections & Files")
 		self.content.grid(row=3, column=0, sticky="nsew", padx=10, pady=(0, 10))
 
+		# Re-window rows whenever the view moves (scroll, resize, content height change)
+		self._scrollbar_set = self.content._scrollbar.set
+		self.content._parent_canvas.configure(yscrollcommand=self._on_content_yscroll)
+		# One resize handler for all rows ("+" keeps the frame's own scrollregion binding)
+		self.content.bind("<Configure>", self._on_content_configure, add="+")
+
+	def _on_content_configure(self, evt):
+		# Height changes on every re-window; only width affects wrapping
+		if evt.width == self._content_width:
+			return
+		self._content_width = evt.width
+		if self._wrap_after_id is not None:
+			self.after_cancel(self._wrap_after_id)
+		self._wrap_after_id = self.after(WRAP_DEBOUNCE_MS, self._apply_wrap_update)
+
+	def _apply_wrap_update(self):
+		self._wrap_after_id = None
+		# In CTk units (wraplength, widths and padx are all scaled by CTk); the event width is in pixels.
+		# Rows are narrower than the content by the section container's padx (16 each side)
+		wrap = max(200, self._reverse_widget_scaling(self._content_width) - 32 - RESERVED_ROW_PX)
+		if wrap == self._wrap_length:
+			return
+		self._wrap_length = wrap
+		self._elided.clear()
+		for w in self.item_widgets.values():
+			self._apply_row_wrap(w)
+
+	def _apply_row_wrap(self, w: Dict):
+		if self._wrap_length and w["wrap"] != self._wrap_length:
+			w["lbl"].configure(wraplength=self._wrap_length)
+			w["wrap"] = self._wrap_length
+			self._set_row_text(w)
+
+	def _set_row_text(self, w: Dict):
+		# Rows have a fixed height that fits two lines, so longer names are elided (full name in a tooltip)
+		name = str(self.item_data[w["item_id"]]["name"])
+		text = name
+		if self._wrap_length:
+			key = (name, self._wrap_length)
+			text = self._elided.get(key)
+			if text is None:
+				text = self._elided[key] = elide_to_lines(name, self._row_font.measure, self._wrap_length)
+		w["elided"] = text != name
+		w["lbl"].configure(text=text)
+
+	def _show_name_tip(self, w: Dict, event):
+		self._hide_name_tip()
+		if not w.get("elided"):
+			return
+		tip = tkinter.Toplevel(self)
+		tip.overrideredirect(True)
+		tip.geometry(f"+{event.x_root + 12}+{event.y_root + 16}")
+		tkinter.Label(
+			tip, text=str(self.item_data[w["item_id"]]["name"]), justify="left",
+			wraplength=600, bg="#2b2b2b", fg="#eaeaea", padx=6, pady=3
+		).pack()
+		self._name_tip = tip
+
+	def _hide_name_tip(self, _event=None):
+		if self._name_tip is not None:
+			self._name_tip.destroy()
+			self._name_tip = None
+
+	def _on_content_yscroll(self, first, last):
+		self._scrollbar_set(first, last)
+		self._schedule_viewport_update()
+
+	def _schedule_viewport_update(self):
+		if self._viewport_after_id is None:
+			self._viewport_after_id = self.after_idle(self._update_viewport)
+
+	def _update_viewport(self):
+		self._viewport_after_id = None
+		for section in self.visible_sections:
+			if not self.section_view_collapsed.get(section, False):
+				self._layout_section_rows(section)
+
+	def _on_container_map(self, _evt=None):
+		self._schedule_viewport_update()
+
+	def _row_pitch(self) -> int:
+		"""Screen pixels per row: the row height plus pady=2 above and below, each scaled (and rounded) by CTk."""
+		return self._apply_widget_scaling(ROW_HEIGHT_PX) + 2 * self._apply_widget_scaling(2)
+
+	def _on_filter_key(self, _evt=None):
+		# Debounce: only rebuild once typing pauses
+		if self._filter_after_id is not None:
+			self.after_cancel(self._filter_after_id)
+		self._filter_after_id = self.after(FILTER_DEBOUNCE_MS, self._on_filter_timer)
+
+	def _on_filter_timer(self):
+		self._filter_after_id = None
+		self._apply_filter()
+
 	def _open_course_folder(self):
 		if self.course_path:
 			reveal_in_file_manager(self.course_path)
 
 	def load_course(self, course_id: int):
+		# Pending toggles belong to the course being left
+		self._flush_toggles()
+		self._flush_section_state()
 		self.course_id = course_id
 
-		c = None
-		for row in self.app.db.list_courses():
-			if row.id == course_id:
-				c = row
-				break
-
+		c = self.app.db.get_course(course_id)
 		if not c:
 			messagebox.showerror("Not found", "Course not found in library.")
 			self.app.show_library()
@@ -882,7 +1210,7 @@ class CoursePage(ctk.CTkFrame):
 		self.section_persisted_collapsed = self.app.db.get_section_collapsed_map(course_id)
 		self.section_view_collapsed = dict(self.section_persisted_collapsed)
 
-		self._rebuild_ui(highlight_last=True)
+		self._build_ui(highlight_last=True)
 
 	def _rescan(self):
 		if not self.course_path:
@@ -897,8 +1225,8 @@ class CoursePage(ctk.CTkFrame):
 			messagebox.showerror("Scan failed", str(e))
 			return
 
-		self._rebuild_ui(highlight_last=True)
-		self.app.library_page.refresh()
+		self._build_ui(highlight_last=True)
+		self.app.library_page.invalidate()
 
 	# --- Memory rules ---
 
@@ -916,6 +1244,8 @@ class CoursePage(ctk.CTkFrame):
 		if not self.course_id:
 			return
 
+		self._cancel_section_flush()
+		self._dirty_sections.clear()
 		self.app.db.clear_section_state(self.course_id)
 
 		for s in list(self.section_containers.keys()):
@@ -937,11 +1267,25 @@ class CoursePage(ctk.CTkFrame):
 		# Update view + persisted
 		self.section_view_collapsed[section] = new_state
 		self.section_persisted_collapsed[section] = new_state
-		self.app.db.set_section_collapsed(self.course_id, section, collapsed=new_state)
+		self._dirty_sections[section] = new_state
+		self._cancel_section_flush()
+		self._section_flush_after_id = self.after(SECTION_STATE_FLUSH_MS, self._flush_section_state)
 
 		self._apply_section_visibility(section)
 		self._refresh_section_toggle_texts()
 
+	def _cancel_section_flush(self):
+		if self._section_flush_after_id is not None:
+			self.after_cancel(self._section_flush_after_id)
+			self._section_flush_after_id = None
+
+	def _flush_section_state(self):
+		"""Write batched section toggles (one transaction)."""
+		self._cancel_section_flush()
+		if self.course_id and self._dirty_sections:
+			self.app.db.set_sections_collapsed(self.course_id, self._dirty_sections)
+		self._dirty_sections = {}
+
 	def _apply_section_visibility(self, section: str):
 		container = self.section_containers.get(section)
 		header = self.section_headers.get(section)
@@ -949,60 +1293,146 @@ class CoursePage(ctk.CTkFrame):
 			return
 
 		collapsed = bool(self.section_view_collapsed.get(section, False))
-		if collapsed:
-			container.pack_forget()
+		# Only touch the geometry manager when the packed state actually changes
+		if collapsed or section not in self.visible_sections:
+			if section in self._packed_sections:
+				container.pack_forget()
+				self._packed_sections.discard(section)
 		else:
-			# Critical fix: ensure it reappears directly under its own header
-			container.pack(after=header, fill="x", padx=16, pady=(0, 2))
+			self._layout_section_rows(section)
+			if section not in self._packed_sections:
+				# Critical fix: ensure it reappears directly under its own header
+				container.pack(after=header, fill="x", padx=16, pady=(0, 2))
+				self._packed_sections.add(section)
+			self._schedule_viewport_update()
+
+	def _visible_range(self, section: str, n: int) -> Tuple[int, int]:
+		"""Slice of the section's shown rows inside the viewport, plus overscan."""
+		container = self.section_containers[section]
+		if n == 0 or not container.winfo_ismapped():
+			# Not laid out yet; the scroll callback fills it in once geometry is known
+			return 0, 0
+
+		pitch = self._row_pitch()
+		first, last = self.content._parent_canvas.yview()
+		total = self.content.winfo_height()
+		y0 = container.winfo_y()
+		# Clamp both ends to [0, n] so the spacers always add up to n rows, even off-screen
+		start = min(max(0, int((first * total - y0) // pitch) - VIRTUAL_OVERSCAN), n)
+		stop = min(n, int((last * total - y0) // pitch) + 1 + VIRTUAL_OVERSCAN)
+		return start, max(start, stop)
+
+	def _layout_section_rows(self, section: str):
+		"""Materialize only the section's rows near the viewport; spacers stand in for the rest."""
+		container = self.section_containers[section]
+		shown_ids = self.section_shown_ids.get(section, [])
+		start, stop = self._visible_range(section, len(shown_ids))
+		window = tuple(shown_ids[start:stop])
+		# Spacer heights are CTk sizes, which get scaled again when applied
+		pitch = self._row_pitch()
+		top_h = self._reverse_widget_scaling(start * pitch)
+		bottom_h = self._reverse_widget_scaling((len(shown_ids) - stop) * pitch)
+
+		top, bottom = self.section_spacers[section]
+		if top_h and top.cget("height") != top_h:
+			top.configure(height=top_h)
+		if bottom_h and bottom.cget("height") != bottom_h:
+			bottom.configure(height=bottom_h)
+
+		layout = (window, top_h > 0, bottom_h > 0)
+		prev = self.section_window.get(section)
+		if layout == prev:
+			return
+
+		keep = set(window)
+		top.pack_forget()
+		bottom.pack_forget()
+		for iid in (prev[0] if prev else ()):
+			w = self.item_widgets.get(iid)
+			if not w:
+				continue
+			if iid in keep:
+				w["frame"].pack_forget()
+			else:
+				# Scrolled or filtered out of the window
+				self._release_row(iid)
+
+		# pack() appends, so re-pack spacer, rows, spacer in order
+		if top_h:
+			top.pack(fill="x")
+		for iid in window:
+			if iid not in self.item_widgets:
+				self.item_widgets[iid] = self._acquire_row(iid)
+			self.item_widgets[iid]["frame"].pack(in_=container, fill="x", pady=2)
+		if bottom_h:
+			bottom.pack(fill="x")
+		self.section_window[section] = layout
 
 	def _refresh_section_toggle_texts(self):
 		for section, btn in self.section_toggle_btns.items():
 			collapsed = bool(self.section_view_collapsed.get(section, False))
 			btn.configure(text="▸" if collapsed else "▾")
 
-	def _rebuild_ui(self, highlight_last: bool = False):
+	def _build_ui(self, highlight_last: bool = False):
+		"""Create section widgets; row widgets are created as they scroll into view."""
+		self._flush_toggles()
+
+		# Build detached so Tk lays the page out once when it is shown again
+		self.content.grid_remove()
+
+		# Row widgets go back to the pool; headers and containers are rebuilt
+		for iid in list(self.item_widgets):
+			self._release_row(iid)
+		pooled = {id(w["frame"]) for w in self._row_pool}
 		for w in self.content.winfo_children():
-			w.destroy()
+			if id(w) not in pooled:
+				w.destroy()
 
-		self.item_widgets.clear()
+		self.item_data.clear()
+		self.item_done.clear()
+		self.item_name_cf.clear()
+		self.highlighted_item_id = None
 		self.ordered_item_ids.clear()
+		self._index_of_id.clear()
 		self.section_headers.clear()
 		self.section_containers.clear()
 		self.section_toggle_btns.clear()
+		self.section_progress_lbls.clear()
+		self.section_item_ids.clear()
+		self.section_shown_ids.clear()
+		self.section_window.clear()
+		self.section_spacers.clear()
+		self._packed_sections.clear()
+		self.visible_sections = []
 
 		if not self.course_id:
+			self.content.grid()
 			return
 
 		items = self.app.db.get_course_items(self.course_id, include_ignored=False)
-		q = norm(self.filter_var.get())
-		hide_done = bool(self.hide_completed_var.get())
 
-		filtered: List[sqlite3.Row] = []
-		for it in items:
-			if hide_done and int(it["completed"] or 0) == 1:
-				continue
-			if q and q not in norm(it["name"]):
-				continue
-			filtered.append(it)
-
-		items_sorted = sorted(filtered, key=lambda r: (natural_key(r["section"]), natural_key(r["rel_path"])))
-		sec_map: Dict[str, List[sqlite3.Row]] = {}
+		# sorted() evaluates the key once per row; sections come out in natural order too
+		items_sorted = sorted(items, key=lambda r: (natural_key(r["section"]), natural_key(r["rel_path"])))
+		# Single pass: group ids by section and record per-item state
 		for it in items_sorted:
-			sec_map.setdefault(str(it["section"]), []).append(it)
+			item_id = int(it["id"])
+			self.section_item_ids.setdefault(str(it["section"]), []).append(item_id)
+			self.item_data[item_id] = it
+			# items.completed is NOT NULL 0/1, so bool() is enough
+			self.item_done[item_id] = bool(it["completed"])
+			self.item_name_cf[item_id] = str(it["name"]).casefold()
 
 		# Ensure defaults exist for new sections
-		for section in sec_map.keys():
+		for section in self.section_item_ids.keys():
 			if section not in self.section_persisted_collapsed:
 				self.section_persisted_collapsed[section] = False
 			if section not in self.section_view_collapsed:
 				self.section_view_collapsed[section] = self.section_persisted_collapsed[section]
 
-		for section in sorted(sec_map.keys(), key=natural_key):
-			sec_items = sec_map[section]
+		for section in self.section_item_ids.keys():
 
-			# Header
+			# Header (packed by _apply_filter)
 			sec_header = ctk.CTkFrame(self.content)
-			sec_header.pack(fill="x", padx=8, pady=(10, 4))
 			self.section_headers[section] = sec_header
 
 			toggle_btn = ctk.CTkButton(
@@ -1020,108 +1450,206 @@ class CoursePage(ctk.CTkFrame):
 			sec_lbl = ctk.CTkLabel(
 				sec_header,
 				text=section,
-				font=ctk.CTkFont(size=15, weight="bold"),
+				font=self._section_font,
 				anchor="w"
 			)
 			sec_lbl.pack(side="left", padx=6, pady=8, fill="x", expand=True)
 			sec_lbl.bind("<Button-1>", lambda _e, s=section: self._toggle_section(s))
 
-			sec_total = len(sec_items)
-			sec_done = sum(1 for it in sec_items if int(it["completed"] or 0) == 1)
-			sec_prog = ctk.CTkLabel(sec_header, text=f"{sec_done}/{sec_total}", anchor="e")
+			sec_prog = ctk.CTkLabel(sec_header, text="", anchor="e")
 			sec_prog.pack(side="right", padx=10, pady=8)
+			self.section_progress_lbls[section] = sec_prog
 
 			# Container for rows (collapsible)
 			container = ctk.CTkFrame(self.content, fg_color="transparent")
+			# Geometry is only known once mapped; fill the row window then
+			container.bind("<Map>", self._on_container_map, add="+")
 			self.section_containers[section] = container
+			self.section_spacers[section] = (
+				ctk.CTkFrame(container, height=1, fg_color="transparent"),
+				ctk.CTkFrame(container, height=1, fg_color="transparent"),
+			)
 
-			for it in sec_items:
-				item_id = int(it["id"])
-				self.ordered_item_ids.append(item_id)
-
-				row = ctk.CTkFrame(container)
-				row.pack(fill="x", pady=2)
-
-				done = int(it["completed"] or 0) == 1
-				var = ctk.BooleanVar(value=done)
-
-				chk = ctk.CTkCheckBox(
-					row,
-					text="",
-					width=22,
-					variable=var,
-					command=lambda iid=item_id, v=var: self._toggle_done(iid, v.get())
-				)
-				chk.pack(side="left", padx=(8, 6), pady=6)
-
-				name = str(it["name"])
-				size = int(it["size_bytes"] or 0)
-
-				lbl = ctk.CTkLabel(row, text=name, anchor="w", justify="left")
-				lbl.pack(side="left", padx=6, pady=6, fill="x", expand=True)
-
-				def _update_wrap(_evt=None, _row=row, _lbl=lbl):
-					# Reserve approx width for: checkbox + meta + 3 buttons + paddings (matches your widths). [file:1]
-					reserved = 22 + 90 + 34 + 70 + 95 + 180
-					w = _row.winfo_width()
-					wrap = max(200, w - reserved)
-					_lbl.configure(wraplength=wrap)
-
-				row.bind("<Configure>", _update_wrap)
-
-				meta = ctk.CTkLabel(row, text=bytes_human(size), width=90, anchor="e", text_color=TEXT_MUTED)
-				meta.pack(side="left", padx=6, pady=6)
-
-				btn_reveal = ctk.CTkButton(
-					row,
-					text="↗",
-					width=34,
-					fg_color=COLOR_NEUTRAL,
-					hover_color=COLOR_NEUTRAL_HOVER,
-					command=lambda p=str(it["abs_path"]): reveal_in_file_manager(p)
-				)
-				btn_reveal.pack(side="right", padx=(6, 8), pady=6)
-
-				btn_open = ctk.CTkButton(row, text="Open", width=70, command=lambda iid=item_id: self._open_item(iid))
-				btn_open.pack(side="right", padx=6, pady=6)
-
-				btn_next = ctk.CTkButton(
-					row,
-					text="Open Next",
-					width=95,
-					fg_color=COLOR_GREEN,
-					hover_color=COLOR_GREEN_HOVER,
-					command=lambda iid=item_id: self._open_next_from(iid)
-				)
-				btn_next.pack(side="right", padx=6, pady=6)
-
-				self.item_widgets[item_id] = {"frame": row, "var": var}
-
-		# Apply collapse states after building (position-safe)
-		for section in list(self.section_containers.keys()):
-			self._apply_section_visibility(section)
-
+		self._apply_filter()
+		self.content.grid()
 		self._refresh_section_toggle_texts()
 		self._update_progress_ui()
 
 		if highlight_last:
 			self._highlight_last_opened_if_any()
 
+	def _acquire_row(self, item_id: int) -> Dict:
+		"""Take a row from the pool (or build one) and bind it to item_id."""
+		w = self._row_pool.pop() if self._row_pool else self._create_row()
+		self._bind_row(w, item_id)
+		self._apply_row_wrap(w)
+		# Pooled rows may predate the current section containers in stacking order
+		w["frame"].lift()
+		return w
+
+	def _release_row(self, item_id: int):
+		w = self.item_widgets.pop(item_id, None)
+		if w:
+			w["frame"].pack_forget()
+			self._row_pool.append(w)
+
+	def _create_row(self) -> Dict:
+		# Rows are children of self.content (packed in_ a section container) so they can move between sections
+		w: Dict = {"item_id": 0, "wrap": 0}
+		row = ctk.CTkFrame(self.content, height=ROW_HEIGHT_PX)
+		# Fixed-height grid: rows never resize to their content, so every row has the same pitch
+		row.grid_propagate(False)
+		row.grid_rowconfigure(0, weight=1)
+		row.grid_columnconfigure(1, weight=1)
+		w["frame"] = row
+
+		# Commands dispatch on w["item_id"], so rebinding a pooled row never touches them
+		w["var"] = ctk.BooleanVar(value=False)
+		w["chk"] = ctk.CTkCheckBox(
+			row, text="", width=22, variable=w["var"],
+			command=functools.partial(self._on_row_toggle, w)
+		)
+		w["chk"].grid(row=0, column=0, padx=(8, 6))
+
+		w["lbl"] = ctk.CTkLabel(row, text="", font=self._row_font, anchor="w", justify="left")
+		w["lbl"].grid(row=0, column=1, padx=6, pady=2, sticky="ew")
+		w["lbl"].bind("<Enter>", functools.partial(self._show_name_tip, w), add="+")
+		w["lbl"].bind("<Leave>", self._hide_name_tip, add="+")
+
+		w["meta"] = ctk.CTkLabel(row, text="", width=90, anchor="e", text_color=TEXT_MUTED)
+		w["meta"].grid(row=0, column=2, padx=6)
+
+		w["btn_reveal"] = ctk.CTkButton(
+			row,
+			text="↗",
+			width=34,
+			fg_color=COLOR_NEUTRAL,
+			hover_color=COLOR_NEUTRAL_HOVER,
+			command=functools.partial(self._on_row_reveal, w)
+		)
+		w["btn_reveal"].grid(row=0, column=5, padx=(6, 8))
+
+		w["btn_open"] = ctk.CTkButton(row, text="Open", width=70, command=functools.partial(self._on_row_open, w))
+		w["btn_open"].grid(row=0, column=4, padx=6)
+
+		w["btn_next"] = ctk.CTkButton(
+			row,
+			text="Open Next",
+			width=95,
+			fg_color=COLOR_GREEN,
+			hover_color=COLOR_GREEN_HOVER,
+			command=functools.partial(self._on_row_next, w)
+		)
+		w["btn_next"].grid(row=0, column=3, padx=6)
+
+		return w
+
+	def _bind_row(self, w: Dict, item_id: int):
+		"""Point a (new or recycled) row's texts and state at item_id."""
+		it = self.item_data[item_id]
+		w["item_id"] = item_id
+		w["var"].set(self.item_done[item_id])
+		self._set_row_text(w)
+		w["meta"].configure(text=bytes_human(int(it["size_bytes"] or 0)))
+
+		if item_id == self.highlighted_item_id:
+			w["frame"].configure(fg_color=(HIGHLIGHT_BG, HIGHLIGHT_BG))
+		else:
+			w["frame"].configure(fg_color=("gray85", "gray20"))
+
+	# --- Row command dispatchers ---
+
+	def _on_row_toggle(self, w: Dict):
+		self._toggle_done(w["item_id"], bool(w["var"].get()))
+
+	def _on_row_reveal(self, w: Dict):
+		it = self.item_data.get(w["item_id"])
+		if it is not None:
+			reveal_in_file_manager(str(it["abs_path"]))
+
+	def _on_row_open(self, w: Dict):
+		self._open_item(w["item_id"])
+
+	def _on_row_next(self, w: Dict):
+		self._open_next_from(w["item_id"])
+
+	def _apply_filter(self):
+		"""Show/hide rows and sections for the current filter; rows are laid out per expanded section."""
+		if not self.course_id:
+			return
+
+		# Filtered in Python: SQLite's lower()/LIKE only fold ASCII, casefold() handles any script
+		q = self.filter_var.get().strip().casefold()
+		hide_done = bool(self.hide_completed_var.get())
+		if q or hide_done:
+			names, done = self.item_name_cf, self.item_done
+			visible_ids = {
+				iid for iid in self.item_data
+				if (not q or q in names[iid]) and not (hide_done and done[iid])
+			}
+		else:
+			visible_ids = set(self.item_data.keys())
+
+		self.ordered_item_ids.clear()
+		self._index_of_id.clear()
+		visible_sections: List[str] = []
+
+		item_done = self.item_done
+		for section, ids in self.section_item_ids.items():
+			# One pass per section: shown ids, their order index and the done count
+			shown_ids: List[int] = []
+			sec_done = 0
+			for iid in ids:
+				if iid in visible_ids:
+					self._index_of_id[iid] = len(self.ordered_item_ids)
+					self.ordered_item_ids.append(iid)
+					shown_ids.append(iid)
+					sec_done += item_done[iid]
+			self.section_shown_ids[section] = shown_ids
+
+			if shown_ids:
+				visible_sections.append(section)
+				self.section_progress_lbls[section].configure(text=f"{sec_done}/{len(shown_ids)}")
+
+		if visible_sections != self.visible_sections:
+			for section in self.section_item_ids:
+				self.section_containers[section].pack_forget()
+				self.section_headers[section].pack_forget()
+			self._packed_sections.clear()
+			self.visible_sections = visible_sections
+			for section in visible_sections:
+				self.section_headers[section].pack(fill="x", padx=8, pady=(10, 4))
+
+		# Apply collapse states after packing headers (position-safe)
+		for section in list(self.section_containers.keys()):
+			self._apply_section_visibility(section)
+
 	def _highlight_last_opened_if_any(self):
 		if not self.course_id:
 			return
-		last_item_id = None
-		for c in self.app.db.list_courses():
-			if c.id == self.course_id:
-				last_item_id = c.last_opened_item_id
-				break
-		if last_item_id and last_item_id in self.item_widgets:
+		c = self.app.db.get_course(self.course_id)
+		last_item_id = c.last_opened_item_id if c else None
+		if last_item_id and last_item_id in self.item_data:
 			self._highlight(last_item_id)
 
 	def _toggle_done(self, item_id: int, done: bool):
-		self.app.db.set_completed(item_id, done)
+		# Coalesce rapid clicks: one transaction and one progress refresh per idle tick
+		self.item_done[item_id] = done
+		self._pending_toggles[item_id] = done
+		if self._toggle_after_id is None:
+			self._toggle_after_id = self.after_idle(self._flush_toggles)
+
+	def _flush_toggles(self):
+		"""Write queued checkbox toggles and refresh progress once."""
+		if self._toggle_after_id is not None:
+			self.after_cancel(self._toggle_after_id)
+			self._toggle_after_id = None
+		if not self._pending_toggles:
+			return
+		pending, self._pending_toggles = self._pending_toggles, {}
+		self.app.db.set_completed_many(pending)
 		self._update_progress_ui()
-		self.app.library_page.refresh()
+		self.app.library_page.invalidate(self.course_id)
 
 	def _update_progress_ui(self):
 		if not self.course_id:
@@ -1146,11 +1674,27 @@ class CoursePage(ctk.CTkFrame):
 
 		safe_open_file(str(it["abs_path"]))
 		self.app.db.record_open(self.course_id, item_id)
-		self.app.library_page.refresh()
+		self.app.library_page.invalidate()
 		self._highlight(item_id)
 
 	def _open_next_from(self, item_id: int):
-		self.app.db.set_completed(item_id, True)
+		self._flush_toggles()
+
+		next_id = None
+		idx = self._index_of_id.get(item_id, -1)
+		if 0 <= idx < len(self.ordered_item_ids) - 1:
+			next_id = self.ordered_item_ids[idx + 1]
+		nxt = self.app.db.get_item_by_id(next_id) if next_id is not None else None
+
+		if nxt is None:
+			self.app.db.set_completed(item_id, True)
+		else:
+			safe_open_file(str(nxt["abs_path"]))
+			# Completion and the open commit together
+			self.app.db.advance(self.course_id, item_id, next_id)
+
+		if item_id in self.item_done:
+			self.item_done[item_id] = True
 
 		# NEW: update the checkbox UI state immediately
 		w = self.item_widgets.get(item_id)
@@ -1162,31 +1706,56 @@ class CoursePage(ctk.CTkFrame):
 
 		# If "Hide completed" is ON, the row should disappear from the list
 		if bool(self.hide_completed_var.get()):
-			# rebuild will re-filter out completed items
-			self._rebuild_ui(highlight_last=False)
+			self._hide_row(item_id)
 
-		try:
-			idx = self.ordered_item_ids.index(item_id)
-		except ValueError:
+		if nxt is None:
+			# Still completed an item: progress changed even with nothing to open
+			self._update_progress_ui()
+			self.app.library_page.invalidate(self.course_id)
 			return
 
-		if idx + 1 >= len(self.ordered_item_ids):
+		self._highlight(next_id)
+
+		# Update progress UI; the library catches up when shown
+		self._update_progress_ui()
+		self.app.library_page.invalidate()
+
+	def _hide_row(self, item_id: int):
+		"""Drop a single row from the current view without re-running the filter."""
+		it = self.item_data.get(item_id)
+		if it is None:
 			return
+		section = str(it["section"])
+		shown_ids = self.section_shown_ids.get(section, [])
+		if item_id not in shown_ids:
+			return
+		shown_ids.remove(item_id)
 
-		next_id = self.ordered_item_ids[idx + 1]
-		self._open_item(next_id)
+		idx = self._index_of_id.pop(item_id, None)
+		if idx is not None:
+			del self.ordered_item_ids[idx]
+			for i in range(idx, len(self.ordered_item_ids)):
+				self._index_of_id[self.ordered_item_ids[i]] = i
 
-		# Update progress UI and other pages
-		self._update_progress_ui()
-		self.app.library_page.refresh()
+		if shown_ids:
+			sec_done = sum(1 for iid in shown_ids if self.item_done[iid])
+			self.section_progress_lbls[section].configure(text=f"{sec_done}/{len(shown_ids)}")
+		else:
+			self.visible_sections.remove(section)
+			self.section_headers[section].pack_forget()
+		self._apply_section_visibility(section)
 
 	def _highlight(self, item_id: int):
-		for iid, w in self.item_widgets.items():
-			frame = w["frame"]
-			if iid == item_id:
-				frame.configure(fg_color=(HIGHLIGHT_BG, HIGHLIGHT_BG))
-			else:
-				frame.configure(fg_color=("gray85", "gray20"))
+		# Only the previous and the new row change color; rows bound later pick this up in _bind_row
+		prev = self.highlighted_item_id
+		self.highlighted_item_id = item_id
+		if prev is not None and prev != item_id:
+			w = self.item_widgets.get(prev)
+			if w:
+				w["frame"].configure(fg_color=("gray85", "gray20"))
+		w = self.item_widgets.get(item_id)
+		if w:
+			w["frame"].configure(fg_color=(HIGHLIGHT_BG, HIGHLIGHT_BG))
 
 
 # -----------------------------
@@ -1266,25 +1835,27 @@ class App(ctk.CTk):
 		self.course_page.grid(row=0, column=0, sticky="nsew")
 
 		self.show_library()
-		self.library_page.refresh()
 
 		self.protocol("WM_DELETE_WINDOW", self.on_close)
 
-		# at the END of __init__:
+		# at the END of __init__: on Windows, CTk.mainloop() withdraws/deiconifies the window
+		# first, which would drop a zoom applied any earlier
 		self.after(0, self._maximize_on_start)
 
 	def _maximize_on_start(self):
-			try:
-				self.update_idletasks()
-				if os.name == "nt":
-					self.state("zoomed")  # Windows
-				else:
-					self.attributes("-zoomed", True)  # Linux (many WMs)
-			except Exception:
-				pass
-			
+		# No update_idletasks(): forcing a layout at the pre-zoom size is wasted work
+		try:
+			if os.name == "nt":
+				self.state("zoomed")  # Windows
+			else:
+				self.attributes("-zoomed", True)  # Linux (many WMs)
+		except Exception:
+			pass
+
 	def on_close(self):
 		try:
+			self.course_page._flush_toggles()
+			self.course_page._flush_section_state()
 			self.db.close()
 		finally:
 			self.destroy()
@@ -1294,7 +1865,8 @@ class App(ctk.CTk):
 
 	def show_library(self):
 		self.library_page.tkraise()
-		self.library_page.refresh()
+		# The library only re-renders if something changed while it was hidden
+		self.library_page.flush_pending()
 
 	def open_course(self, course_id: int):
 		self.course_page.tkraise()
@@ -1302,10 +1874,9 @@ class App(ctk.CTk):
 
 	def continue_course(self, course_id: int):
 		self.open_course(course_id)
-		for c in self.db.list_courses():
-			if c.id == course_id and c.last_opened_item_id:
-				self.course_page._open_item(c.last_opened_item_id)
-				return
+		c = self.db.get_course(course_id)
+		if c and c.last_opened_item_id:
+			self.course_page._open_item(c.last_opened_item_id)
 
 	def add_course_folder(self):
 		path = filedialog.askdirectory(title="Select a course folder")
@@ -1322,7 +1893,7 @@ class App(ctk.CTk):
 			messagebox.showerror("Add course failed", str(e))
 			return
 
-		self.library_page.refresh()
+		self.library_page.invalidate()
 		self.open_course(course_id)
 
 	def show_last_file_global(self):